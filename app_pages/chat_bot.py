@@ -0,0 +1,170 @@
+import streamlit as st
+import base64
+import hashlib
+from openai import OpenAI
+from descriptions import DESCRIPTION_PROMPT, IMAGE_QUESTION
+
+# Constants
+# chat bot keeps at most this many messages, older ones are summarized
+CHAT_HISTORY_LIMIT = 10
+CHAT_HISTORY_KEEP = 4
+
+
+def chat_bot():
+    """Chat bot functionality using OpenAI."""
+    st.write("## Chat Bot")
+    if "api_key" not in st.session_state or st.session_state.api_key is None:
+        st.warning("Bitte zuerst API Key eingeben")
+        return
+    if "chat" not in st.session_state:
+        st.session_state.chat = []
+    if "chat_summary" not in st.session_state:
+        st.session_state.chat_summary = ""
+    if "image_descriptions" not in st.session_state:
+        st.session_state.image_descriptions = {}
+    if "active_image" not in st.session_state:
+        st.session_state.active_image = None
+
+    option = st.selectbox(
+        "Wählen Sie einen Chatbot",
+        ("Bild hochladen", "Text zu Bild"),
+        )
+
+    if option == "Bild hochladen":
+        messages = st.container(height=300)
+        uploaded_image = st.file_uploader("Upload an image", type=["png", "jpg", "jpeg"])
+
+        if uploaded_image is not None:
+            image_bytes = uploaded_image.getvalue()
+            image_hash = hashlib.sha256(image_bytes).hexdigest()
+            # every rerun sees the same upload again, only describe unknown images
+            if image_hash not in st.session_state.image_descriptions:
+                client = OpenAI(api_key=st.session_state.api_key)
+                st.session_state.image_descriptions[image_hash] = (
+                    describe_uploaded_image(client, image_bytes, uploaded_image.type)
+                )
+            # a different image starts a new conversation about that image
+            if image_hash != st.session_state.active_image:
+                st.session_state.active_image = image_hash
+                st.session_state.chat_summary = ""
+                st.session_state.chat = [
+                    {"role": "user", "content": IMAGE_QUESTION},
+                    {
+                        "role": "assistant",
+                        "content": st.session_state.image_descriptions[image_hash],
+                    },
+                ]
+        else:
+            st.session_state.active_image = None
+
+        if st.session_state.active_image is not None:
+            if prompt := st.chat_input("Weitere Frage zum Bild stellen"):
+                client = OpenAI(api_key=st.session_state.api_key)
+                add_chat_message(client, {"role": "user", "content": prompt})
+                answer = answer_image_question(client)
+                add_chat_message(client, {"role": "assistant", "content": answer})
+
+        if st.session_state.chat_summary:
+            messages.write(f"*Bisheriger Verlauf:* {st.session_state.chat_summary}")
+        for message in st.session_state.chat:
+            if message["role"] == "assistant":
+                messages.write(message["content"], unsafe_allow_html=True)
+            else:
+                messages.write(f"**Du:** {message['content']}")
+
+        if uploaded_image is not None:
+            st.image(uploaded_image, width=200)
+
+        if uploaded_image is not None:
+            uploaded_image.close()
+
+    if option == "Text zu Bild":
+        input = st.text_input("Was wollen Sie für ein Bild generieren?")
+
+        if input:
+            client = OpenAI(api_key=st.session_state.api_key)
+            response = client.images.generate(
+                model="dall-e-3",
+                prompt=input,
+                size="1024x1024",
+                quality="standard",
+                n=1,
+            )
+
+            image_url = response.data[0].url
+
+            st.image(image_url)
+
+
+def describe_uploaded_image(client, image_bytes, mime_type):
+    """Describe an uploaded image once, the result is stored by image hash."""
+    image_64 = base64.b64encode(image_bytes).decode("utf-8")
+    messages = [
+        {"role": "system", "content": DESCRIPTION_PROMPT},
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": IMAGE_QUESTION},
+                {
+                    "type": "image_url",
+                    "image_url": {"url": f"data:{mime_type};base64,{image_64}"},
+                },
+            ],
+        },
+    ]
+    completion = client.chat.completions.create(model="gpt-4o-mini", messages=messages)
+    return completion.choices[0].message.content
+
+
+def answer_image_question(client):
+    """Answer a follow-up question using the stored description instead of the image."""
+    description = st.session_state.image_descriptions[st.session_state.active_image]
+    messages = [
+        {"role": "system", "content": DESCRIPTION_PROMPT},
+        {
+            "role": "system",
+            "content": f"Beschreibung des hochgeladenen Bildes: {description}",
+        },
+    ]
+    if st.session_state.chat_summary:
+        messages.append(
+            {
+                "role": "system",
+                "content": f"Zusammenfassung des bisherigen Gesprächs: {st.session_state.chat_summary}",
+            }
+        )
+    # the follow-up question is already the last entry of the history
+    messages += [
+        {"role": message["role"], "content": message["content"]}
+        for message in st.session_state.chat
+    ]
+    completion = client.chat.completions.create(model="gpt-4o-mini", messages=messages)
+    return completion.choices[0].message.content
+
+
+def add_chat_message(client, message):
+    """Append a message to the chat and fold older turns into a summary."""
+    st.session_state.chat.append(message)
+    if len(st.session_state.chat) <= CHAT_HISTORY_LIMIT:
+        return
+    older = st.session_state.chat[:-CHAT_HISTORY_KEEP]
+    st.session_state.chat = st.session_state.chat[-CHAT_HISTORY_KEEP:]
+    transcript = "\n".join(
+        f"{'Nutzer' if entry['role'] == 'user' else 'Assistent'}: {entry['content']}"
+        for entry in older
+    )
+    messages = [
+        {
+            "role": "system",
+            "content": "Fasse den folgenden Gesprächsverlauf über Produktbilder in wenigen Sätzen zusammen. Behalte wichtige Details zu Produkten und Verpackungen bei.",
+        },
+        {
+            "role": "user",
+            "content": f"{st.session_state.chat_summary}\n{transcript}".strip(),
+        },
+    ]
+    completion = client.chat.completions.create(model="gpt-4o-mini", messages=messages)
+    st.session_state.chat_summary = completion.choices[0].message.content
+
+
+chat_bot()
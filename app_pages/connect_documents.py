@@ -0,0 +1,43 @@
+import streamlit as st
+import utils
+
+
+def connect_documents():
+    """Functionality to connect documents."""
+    st.write("## Dokumente verbinden")
+    st.write("Hier können Dokumente miteinander verbunden werden.")
+
+    # Here we can upload 7 Documents which are getting stiched afterwards
+    document_names = [
+        "Material Allgemein",
+        "Material ME Eigenschaften",
+        "Materialkomponenten",
+        "Textilkomponenten",
+        "Verpackung",
+        "Zusatzinformationen NEU 2",
+        "Zusatzinformationen",
+    ]
+
+    st.session_state.uploaded_files = []
+    cols = st.columns(3)
+    for i in range(7):
+        with cols[i % 3]:
+            uploaded_file = st.file_uploader(f"{document_names[i]}", type=["xml"])
+            if uploaded_file is not None:
+                st.session_state.uploaded_files.append(uploaded_file)
+
+    if len(st.session_state.uploaded_files) == 7:
+        st.success("Alle Dokumente wurden hochgeladen")
+        if st.button("Dokumente verbinden"):
+            st.write("Dokumente werden verbunden")
+            stitched_doc = stitch_documents(st.session_state.uploaded_files)
+
+
+def stitch_documents(doc_list):
+    # First of all we need to read the content of the uploaded files
+    document_content = []
+    for index, doc in enumerate(doc_list):
+        utils.extract_docs(index, doc)
+
+
+connect_documents()
@@ -0,0 +1,35 @@
+import streamlit as st
+
+
+@st.cache_data
+def convert_df(df):
+    """Convert a DataFrame to CSV format."""
+    return df.to_csv().encode("utf-8")
+
+
+def download_data(df):
+    st.write("## Daten herunterladen")
+    st.write("Fertige Datensets herunterladen")
+    csv_data = convert_df(df)
+    csv_trends = convert_df(st.session_state.trend_analysis)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            label="Datensatz als csv herunterladen",
+            data=csv_data,
+            file_name="data.csv",
+            mime="text/csv",
+        )
+    with col2:
+        st.download_button(
+            label="Trendanalyse als csv herunterladen",
+            data=csv_trends,
+            file_name="trends.csv",
+            mime="text/csv",
+        )
+
+
+if st.session_state.uploaded_df is not None:
+    download_data(st.session_state.uploaded_df)
+else:
+    st.write("Bisher keine Daten hochgeladen")
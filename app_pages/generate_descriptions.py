@@ -0,0 +1,104 @@
+import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from openai import OpenAI
+from descriptions import (
+    DESCRIPTION_TIERS,
+    MIN_CONFIDENCE,
+    generate_description,
+    store_attributes,
+    summarize_calls,
+)
+
+
+def evaluate_images(df):
+    """Evaluate images and generate descriptions using OpenAI."""
+    st.write("## Beschreibungen generieren")
+    if "api_key" not in st.session_state or st.session_state.api_key is None:
+        st.warning("Bitte zuerst API Key eingeben")
+        return
+    client = OpenAI(api_key=st.session_state.api_key)
+
+    st.write(
+        "Hier können Beschreibungen für die hochgeladenen Produkte generiert werden."
+    )
+    structured = st.toggle(
+        "Strukturierte Beschreibungen",
+        value=False,
+        help="Merkmale werden zusätzlich als eigene Spalten gespeichert",
+    )
+    regenerate = st.toggle("Vorhandene Beschreibungen neu generieren", value=False)
+    pending = df[df["Ranking in der Kategorie"].isin(range(1, 10))]
+    if not regenerate:
+        pending = pending[pending["Beschreibung"] == ""]
+    tiers = st.multiselect(
+        "Modellstufen",
+        list(DESCRIPTION_TIERS),
+        default=list(DESCRIPTION_TIERS),
+        help="Nur Beschreibungen, die die Qualitätsprüfung nicht bestehen, gehen an die nächste Stufe",
+    )
+    tiers = [tier for tier in DESCRIPTION_TIERS if tier in tiers]
+    min_confidence = st.slider(
+        "Mindestkonfidenz der Merkmale",
+        0.0,
+        1.0,
+        MIN_CONFIDENCE,
+        disabled=not structured,
+        help="Durchschnittliche Token-Wahrscheinlichkeit der Merkmalswerte, darunter geht das Produkt an die nächste Stufe",
+    )
+    if regenerate:
+        st.write(f"{len(pending)} Produkte werden neu beschrieben")
+    else:
+        st.write(f"{len(pending)} Produkte ohne aktuelle Beschreibung")
+    if st.button("Beschreibungen generieren", disabled=not tiers):
+        progress_text = "Generating descriptions for images..."
+        my_bar = st.progress(0, progress_text)
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            futures = [
+                executor.submit(
+                    generate_description,
+                    client,
+                    row["Produktbild URL"],
+                    index,
+                    structured,
+                    tiers,
+                    min_confidence,
+                )
+                for index, row in pending.iterrows()
+            ]
+            attributes = {}
+            calls = []
+            for i, future in enumerate(futures):
+                index, description, _, product_attributes, product_calls = (
+                    future.result()
+                )
+                st.session_state.uploaded_df.at[index, "Beschreibung"] = description
+                attributes[index] = product_attributes
+                calls += product_calls
+                my_bar.progress((i + 1) / len(futures))
+        store_attributes(st.session_state.uploaded_df, attributes)
+        st.session_state.cascade_stats = summarize_calls(calls)
+        my_bar.progress(1.0)
+        st.success("Beschreibungen wurden generiert")
+        st.rerun()
+    if st.session_state.get("cascade_stats") is not None:
+        st.write("### Letzter Durchlauf")
+        st.dataframe(st.session_state.cascade_stats)
+    st.write("### Beschreibungen der Top 100 Produkte")
+    if st.button("Beschreibungen anzeigen"):
+        cols = st.columns(3)
+        products_with_descriptions = df[df["Beschreibung"] != ""]
+        for i, row in products_with_descriptions.iterrows():
+            with cols[i % 3]:
+                st.markdown(
+                    f"""<a href="{row['Produkt URL']}" target="_blank">![{row['Produktname']}]({row['Produktbild URL']})</a>""",
+                    unsafe_allow_html=True,
+                )
+                st.write(f"**{row['Produktname']}**")
+                with st.expander("Beschreibung"):
+                    st.write(row["Beschreibung"])
+
+
+if st.session_state.uploaded_df is not None:
+    evaluate_images(st.session_state.uploaded_df)
+else:
+    st.write("Bisher keine Daten hochgeladen")
@@ -0,0 +1,125 @@
+import streamlit as st
+from history import category_movements, count_snapshots
+
+
+def display_data(df):
+    """Display the uploaded data and some key metrics."""
+    st.write("## Datensatz")
+    st.write("### Informationen zum hochgeladenen Datensatz")
+    with st.expander("Informationen anzeigen"):
+        cols = st.columns(4)
+        with cols[0]:
+            st.metric("Kategorien", df["Kategorie"].nunique())
+        with cols[1]:
+            st.metric("Anzahl von Produkten", len(df))
+        with cols[2]:
+            st.metric("Anzahl von Unique Produkten", df["Produktname"].nunique())
+        with cols[3]:
+            st.metric("Anzahl von Beschreibungen", len(df[df["Beschreibung"] != ""]))
+        with cols[0]:
+            st.metric(
+                "Avg Preis",
+                f"{format(df["Produktpreis"].mean(), ".2f")} €",
+            )
+        with cols[1]:
+            st.metric(
+                "Avg Ranking",
+                f"{format(df["Durchschnittliche Produktbewertung (1=schlechteste Note, 5=beste Note)"].mean(), ".2f")}",
+            )
+        with cols[2]:
+            st.metric(
+                "Avg Abverkaufsmenge",
+                f"{format(df["Abverkaufsmenge"].mean(), ".2f")}",
+            )
+        with cols[3]:
+            st.metric("Uploads in der Historie", count_snapshots())
+    st.divider()
+    show_products(df)
+
+
+@st.fragment
+def show_products(df):
+    """Display products based on the selected category."""
+    if df is not None:
+        category = st.selectbox(
+            "Kategorie",
+            ["Alle"] + list(df["Kategorie"].unique()),
+        )
+        if category == "Alle":
+            display_all_categories(df)
+        else:
+            display_category(df, category)
+    else:
+        st.write("Bisher keine Daten hochgeladen")
+
+
+def display_all_categories(df):
+    """Display all categories and their top products."""
+    categories = df["Kategorie"].unique()
+    for category in categories:
+        st.write(f"### {category} Top 3")
+        category_df = df[df["Kategorie"] == category]
+        top_ranked = category_df[
+            category_df["Ranking in der Kategorie"].isin([1, 2, 3])
+        ]
+        display_images(top_ranked, True)
+    st.write(df)
+
+
+@st.fragment
+def display_category(df, category):
+    """Display top products for a specific category."""
+    category_df = df[df["Kategorie"] == category]
+    num = st.slider(
+        "Wie viele Produkte sollen angezeigt werden?", 1, len(category_df), 10
+    )
+    top_ranked = category_df[
+        category_df["Ranking in der Kategorie"].isin(range(1, num + 1))
+    ]
+    st.write(f"### {category} Top {num}")
+    with st.expander("Informationen anzeigen"):
+        cols = st.columns(3)
+        with cols[0]:
+            st.metric(
+                "Avg Preis",
+                f"{format(top_ranked["Produktpreis"].mean(), ".2f")} €",
+            )
+        with cols[1]:
+            st.metric(
+                "Avg Ranking",
+                f"{format(top_ranked["Durchschnittliche Produktbewertung (1=schlechteste Note, 5=beste Note)"].mean(), ".2f")}",
+            )
+        with cols[2]:
+            st.metric(
+                "Avg Abverkaufsmenge",
+                f"{format(top_ranked["Abverkaufsmenge"].mean(), ".2f")}",
+            )
+    if st.session_state.get("snapshot_id") is not None:
+        with st.expander("Veränderung zum vorherigen Upload"):
+            st.dataframe(
+                category_movements(st.session_state.snapshot_id, category, num),
+                hide_index=True,
+            )
+    st.divider()
+    display_images(top_ranked, False)
+    st.write(top_ranked)
+
+
+def display_images(df, cat):
+    """Display images of products in a DataFrame."""
+    cols = st.columns(3)
+    for i, row in df.iterrows():
+        with cols[i % 3]:
+            st.markdown(
+                f"""<a href="{row['Produkt URL']}" target="_blank">![{row['Produktname']}]({row['Produktbild URL']})</a>""",
+                unsafe_allow_html=True,
+            )
+            st.write(f"**{row['Produktname']}**")
+            if cat:
+                st.metric(label="Preis", value=f"{row['Produktpreis']}€", delta="0,2 €")
+
+
+if st.session_state.uploaded_df is not None:
+    display_data(st.session_state.uploaded_df)
+else:
+    st.write("Bisher keine Daten hochgeladen")
@@ -0,0 +1,342 @@
+import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from openai import OpenAI
+from descriptions import DESCRIPTION_ATTRIBUTES
+from history import RATING_COLUMN
+
+# Constants
+# words ignored when counting terms, terms have at least four letters
+STOPWORDS = {
+    "aber", "auch", "beim", "dass", "diese", "dieser", "eine", "einem", "einen",
+    "einer", "eines", "keine", "mehr", "oder", "sind", "wird", "zwei", "sowie",
+    "über", "form", "farbe", "muster", "details", "produkt", "produkts",
+    "verpackung", "einheiten", "anzahl", "bild", "bildes", "sehen", "with",
+}
+
+
+def trend_analysis(df):
+    """Perform trend analysis on the uploaded data."""
+    st.write("## Trendanalyse")
+
+    st.write("Hallo")
+
+    if "api_key" not in st.session_state or st.session_state.api_key is None:
+        st.warning("Bitte zuerst API Key eingeben")
+        return
+    client = OpenAI(api_key=st.session_state.api_key)
+
+    
+
+
+    st.write(
+        "Hier kann eine Trendanalyse der hochgeladenen Produkte durchgeführt werden."
+    )
+    if "trend_analysis" in st.session_state:
+        st.success("Trendanalyse wurde bereits durchgeführt")
+        show_trends(st.session_state.trend_analysis)
+    elif df is None:
+        st.write("Bitte zuerst Daten hochladen")
+    else:
+        if st.button("Analyse starten"):
+            trend_analysis = pd.DataFrame()
+            st.success("Analyse wird durchgeführt")
+            progress_text = "Analysiere Trends..."
+            my_bar = st.progress(0, progress_text)
+            i = 0
+            df_trend = df[df["Ranking in der Kategorie"].isin(range(1, 6))]
+            statistics = category_statistics(df)
+            trends_per_category = {
+                category: df_trend[df_trend["Kategorie"] == category]
+                for category in df_trend["Kategorie"].unique()
+            }
+            with ThreadPoolExecutor(max_workers=20) as executor:
+                futures = [
+                    executor.submit(
+                        generate_trend,
+                        client,
+                        category,
+                        category_df,
+                        statistics.get(category, ""),
+                    )
+                    for category, category_df in trends_per_category.items()
+                ]
+                for future in futures:
+                    i += 1
+                    my_bar.progress(i / len(futures))
+                    trend_analysis = pd.concat(
+                        [
+                            trend_analysis,
+                            pd.DataFrame(
+                                {
+                                    "Kategorie": [future.result()[0]],
+                                    "Trends": [future.result()[1]],
+                                }
+                            ),
+                        ]
+                    )
+            my_bar.progress(1.0)
+            st.session_state.trend_analysis = trend_analysis
+            st.success("Analyse abgeschlossen")
+            st.rerun()
+
+
+@st.fragment
+def show_trends(trend_df):
+    """Display the trends of the selected category."""
+    cat = st.selectbox(
+        "Kategorie",
+        ["Alle"] + list(trend_df["Kategorie"].unique()),
+    )
+    if cat == "Alle":
+        for i, row in trend_df.iterrows():
+            st.write(f"### {row['Kategorie']}")
+            st.write(row["Trends"])
+            st.divider()
+    else:
+        st.write(f"### {cat}")
+        st.write(trend_df[trend_df["Kategorie"] == cat]["Trends"].values[0])
+
+
+def trend_analyse_self():
+    st.write("## Trendanalyse")
+
+    if "api_key" not in st.session_state or st.session_state.api_key is None:
+        st.warning("Bitte zuerst API Key eingeben")
+        return
+    client = OpenAI(api_key=st.session_state.api_key)
+    
+    if "api_key" not in st.session_state or st.session_state.api_key is None:
+        st.warning("Bitte zuerst API Key eingeben")
+        return
+
+    if "messages" not in st.session_state:
+        st.session_state.messages = []
+
+    for message in st.session_state.messages:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+
+    # React to user input
+    if prompt := st.chat_input("Wie kann ich Dir helfen?"):
+        # Display user message in chat message container
+        st.chat_message("user").markdown(prompt)
+        # Add user message to chat history
+        st.session_state.messages.append({"role": "user", "content": prompt})
+
+        # Get response from OpenAI
+        response = openai(client, prompt)
+
+        # Display OpenAI response in chat message container
+        st.chat_message("bot").markdown(response)
+
+        # Add OpenAI response to chat history
+        st.session_state.messages.append({"role": "bot", "content": response})
+
+
+def category_statistics(df, top_terms=15):
+    """Compute price, sales, rating and term statistics for all categories.
+
+    Everything is aggregated in grouped pandas operations over the whole
+    dataset, the result maps each category to a compact text block for the
+    trend prompt.
+    """
+    grouped = df.groupby("Kategorie", sort=False)
+    prices = grouped["Produktpreis"].quantile([0, 0.25, 0.5, 0.75, 1]).unstack()
+    sales = grouped["Abverkaufsmenge"].agg(["count", "sum", "median", "max"])
+    top_sales = (
+        df[df["Ranking in der Kategorie"].isin(range(1, 6))]
+        .groupby("Kategorie", sort=False)
+        .agg(
+            top_preis=("Produktpreis", "mean"),
+            top_abverkauf=("Abverkaufsmenge", "sum"),
+        )
+    )
+
+    # pearson correlation per category from grouped moments
+    pairs = df[["Kategorie", RATING_COLUMN, "Abverkaufsmenge"]].dropna()
+    x = pairs[RATING_COLUMN].astype(float)
+    y = pairs["Abverkaufsmenge"].astype(float)
+    moments = (
+        pd.DataFrame({"x": x, "y": y, "xx": x * x, "yy": y * y, "xy": x * y})
+        .groupby(pairs["Kategorie"].values, sort=False)
+        .mean()
+    )
+    variance = (moments["xx"] - moments["x"] ** 2) * (moments["yy"] - moments["y"] ** 2)
+    correlation = (moments["xy"] - moments["x"] * moments["y"]) / np.sqrt(
+        variance.where(variance > 0)
+    )
+
+    text = df["Produktname"].fillna("").astype(str)
+    if "Beschreibung" in df:
+        text = text + " " + df["Beschreibung"].fillna("").astype(str)
+    terms = (
+        pd.DataFrame(
+            {
+                "Kategorie": df["Kategorie"].values,
+                "term": text.str.lower().str.findall(r"[a-zäöüß]{4,}").values,
+            }
+        )
+        .explode("term")
+        .dropna(subset="term")
+    )
+    terms = terms[~terms["term"].isin(STOPWORDS)]
+    term_counts = (
+        terms.groupby("Kategorie", sort=False)["term"]
+        .value_counts()
+        .groupby(level=0, sort=False)
+        .head(top_terms)
+    )
+
+    statistics = {}
+    for category in sales.index:
+        p = prices.loc[category]
+        lines = [
+            f"Kennzahlen der Kategorie {category} ({sales.at[category, 'count']} Produkte):",
+            f"- Preis: min {p[0]:.2f} €, Q1 {p[0.25]:.2f} €, Median {p[0.5]:.2f} €, Q3 {p[0.75]:.2f} €, max {p[1]:.2f} €",
+            f"- Abverkaufsmenge: Summe {sales.at[category, 'sum']:.0f}, Median {sales.at[category, 'median']:.0f}, max {sales.at[category, 'max']:.0f}",
+        ]
+        if category in top_sales.index and sales.at[category, "sum"] > 0:
+            share = top_sales.at[category, "top_abverkauf"] / sales.at[category, "sum"]
+            lines.append(
+                f"- Top 5: Ø Preis {top_sales.at[category, 'top_preis']:.2f} €, Anteil an der Abverkaufsmenge {share:.0%}"
+            )
+        if pd.notna(correlation.get(category)):
+            lines.append(
+                f"- Korrelation Bewertung/Abverkaufsmenge: {correlation[category]:.2f}"
+            )
+        if category in term_counts.index.get_level_values(0):
+            lines.append(
+                "- Häufige Begriffe: "
+                + ", ".join(
+                    f"{term} ({count})"
+                    for term, count in term_counts.loc[category].items()
+                )
+            )
+        statistics[category] = "\n".join(lines)
+    return statistics
+
+
+def trend_input(category_df):
+    """Build the product data sent to the model for a trend analysis.
+
+    Products with structured attributes are sent as a compact CSV table,
+    the free text descriptions of all other products are added below.
+    """
+    columns = list(DESCRIPTION_ATTRIBUTES.values())
+    if not all(column in category_df for column in columns):
+        return category_df["Beschreibung"].to_json()
+    structured = category_df[columns].notna().any(axis=1)
+    if not structured.any():
+        return category_df["Beschreibung"].to_json()
+    parts = [
+        "Produktmerkmale:\n"
+        + category_df.loc[structured, ["Produktname"] + columns].to_csv(index=False)
+    ]
+    if not structured.all():
+        parts.append(
+            "Weitere Produktbeschreibungen:\n"
+            + category_df.loc[~structured, "Beschreibung"].to_json()
+        )
+    return "\n".join(parts)
+
+
+def generate_trend(client, category, category_df, statistics=""):
+    """Generate trends for a category using OpenAI."""
+    messages = [
+        {
+            "role": "system",
+            "content": f"""
+                Du bist Theresa, der Trendscout. Bitte führen Sie eine personalisierte Trendanalyse der Produktdaten des Nutzers durch.
+
+                Nach einer Begrüßung befolge die folgenden Schritte, um die vom Nutzer hochgeladenen produktbezogenen Daten zu analysieren und Trends zu identifizieren. 
+
+                # Schritte 
+
+                - Analyse der Produkte ausschließlich basierend auf den bereitgestellten Beschreibungen aus der Kategorie: {category}.
+                - Trends in den folgenden Dimensionen identifizieren und beschreiben: Produkt, Bild, Form, Komponente, Verpackung und Verkauf.
+
+                # Trendanalyse-Dimensionen
+
+                1. **Produkt:** Art, Zielgruppe, Benefits
+                2. **Bild:** Farbpalette, Muster, Bildelemente
+                3. **Form:** Abmessungen, Gewicht, Silhouette/Form
+                4. **Komponente:** Textil- oder andere Komponenten
+                5. **Verpackung:** Abmessungen, Anzahl der Einheiten, Komponenten
+                6. **Verkauf:** Preis, Abverkaufsmenge und Wiederkauf, basierend auf den mitgelieferten Kennzahlen der Kategorie
+
+                Für jede Dimension werden drei Trends identifiziert und mit konkreten Beispielen aus den analysierten Produkten illustriert. Zusätzlich werden drei innovative Produkte hervorgehoben, die sich signifikant von den normalen Produkten der Kategorie unterscheiden.
+
+                # Output Format
+
+                Die Ergebnisse sollten in natürlicher Sprache verfasst und in folgender Struktur präsentiert werden:
+
+                - **Einleitung:** Persönliche Begrüßung und Überblick.
+                - **Trendergebnisse:** Drei detaillierte Trendbeschreibungen pro Dimension mit Beispielen.
+                - **Innovative Produkte:** Auflistung von drei neuen und sich unterscheidenden Produkten der Kategorie.
+
+                # Beispiele
+
+                **Beispiel:**
+
+                **Einleitung:** "Hallo, willkommen zur Trendanalyse!"
+
+                **Trendergebnisse:**
+                - **Produkt:** 
+                - Trend 1: [Beschreibung und Beispiele]
+                - Trend 2: [Beschreibung und Beispiele]
+                - Trend 3: [Beschreibung und Beispiele]
+
+                **Innovative Produkte:**
+                - Produkt A: [Beschreibung]
+                - Produkt B: [Beschreibung]
+                - Produkt C: [Beschreibung]
+
+                # Notes
+
+                - Theresa verwendet keine zusätzlichen Quellen außer den vom Nutzer bereitgestellten Produktbeschreibungen und Kennzahlen.
+                - Alle Trends werden in mindestens drei detaillierten Zeilen beschrieben.
+                - Vermeiden Sie es, eigene Recherchen oder Wissen hinzuzufügen.
+            """
+        },
+        {
+            "role": "user",
+            "content": f"{statistics}\n\n{trend_input(category_df)}".strip(),
+        },
+    ]
+    completion = client.chat.completions.create(model="gpt-4o-mini", messages=messages)
+    return category, completion.choices[0].message.content
+
+
+def openai(client, message: str):
+    client = client
+
+    if "assistant_id" not in st.session_state:
+        st.session_state.assistant_id = st.secrets["assistant_id"]
+
+    if "thread_id" not in st.session_state:
+        thread = client.beta.threads.create()
+        st.session_state.thread_id = thread.id
+
+    message = client.beta.threads.messages.create(
+        thread_id=st.session_state.thread_id, role="user", content=message
+    )
+
+    run = client.beta.threads.runs.create_and_poll(
+        thread_id=st.session_state.thread_id, assistant_id=st.session_state.assistant_id
+    )
+
+    if run.status == "completed":
+        return (
+            client.beta.threads.messages.list(thread_id=st.session_state.thread_id)
+            .data[0]
+            .content[0]
+            .text.value
+        )
+
+
+if st.session_state.uploaded_df is not None:
+    trend_analysis(st.session_state.uploaded_df)
+else:
+    st.write("Bisher keine Daten hochgeladen")
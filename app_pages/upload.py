@@ -0,0 +1,93 @@
+import streamlit as st
+import hashlib
+import pandas as pd
+from descriptions import DESCRIPTION_ATTRIBUTES
+from history import store_snapshot
+
+
+def upload_excel_file(uploaded_file):
+    """Upload and process an Excel file."""
+    try:
+        dataframe = pd.read_excel(uploaded_file)
+        dataframe["Beschreibung"] = ""
+        dataframe["Jahr"] = (
+            dataframe["Jahr"].apply(lambda x: int(str(x).replace(",", ""))).astype(int)
+        )
+        return dataframe
+    except Exception as e:
+        st.error(f"Error uploading file: {e}")
+        return None
+
+
+def fingerprint_products(df):
+    """Fingerprint rows by product and image URL to detect changed products."""
+    return pd.util.hash_pandas_object(
+        df[["Produkt URL", "Produktbild URL"]].astype(str), index=False
+    ).values
+
+
+def merge_upload(previous, df):
+    """Carry over descriptions of unchanged products from a previous upload.
+
+    Products whose product and image URL did not change keep their
+    description and attribute columns, everything else starts empty and is
+    picked up by the next description run. Returns the merged DataFrame and
+    the number of products that are new or changed.
+    """
+    fingerprints = fingerprint_products(df)
+    previous_fingerprints = fingerprint_products(previous)
+    changed = int((~pd.Series(fingerprints).isin(previous_fingerprints)).sum())
+    carried = ["Beschreibung"] + [
+        column for column in DESCRIPTION_ATTRIBUTES.values() if column in previous
+    ]
+    described = (previous["Beschreibung"] != "").values
+    known = (
+        previous.loc[described, carried]
+        .assign(Fingerprint=previous_fingerprints[described])
+        .drop_duplicates("Fingerprint")
+    )
+    merged = (
+        df.drop(columns=[c for c in carried if c in df])
+        .assign(Fingerprint=fingerprints)
+        .merge(known, on="Fingerprint", how="left")
+        .drop(columns="Fingerprint")
+    )
+    merged["Beschreibung"] = merged["Beschreibung"].fillna("")
+    return merged, changed
+
+
+def handle_file_upload():
+    """Handle file upload and store the uploaded DataFrame in session state."""
+    st.write("## Daten hochladen")
+    merge = st.toggle(
+        "Mit vorhandenen Daten zusammenführen",
+        value=True,
+        help="Beschreibungen unveränderter Produkte werden übernommen",
+    )
+    uploaded_file = st.file_uploader("Wähle eine Datei")
+    # the uploader keeps its file across reruns, only process a new upload once
+    if (
+        uploaded_file is not None
+        and uploaded_file.file_id != st.session_state.get("uploaded_file_id")
+    ):
+        df = upload_excel_file(uploaded_file)
+        if df is not None:
+            previous = st.session_state.uploaded_df
+            if merge and previous is not None:
+                df, changed = merge_upload(previous, df)
+                carried = (df["Beschreibung"] != "").sum()
+                st.success(
+                    f"{carried} Beschreibungen übernommen, {changed} Produkte neu oder geändert"
+                )
+            st.session_state.uploaded_df = df
+            st.session_state.uploaded_file_id = uploaded_file.file_id
+            snapshot_id = hashlib.sha256(uploaded_file.getvalue()).hexdigest()
+            store_snapshot(df, snapshot_id)
+            st.session_state.snapshot_id = snapshot_id
+    if st.button("Hochgeladene Daten löschen"):
+        st.session_state.uploaded_df = None
+        st.session_state.uploaded_file_id = None
+        st.session_state.snapshot_id = None
+
+
+handle_file_upload()
@@ -0,0 +1,255 @@
+import json
+import re
+import time
+import numpy as np
+import pandas as pd
+
+# Constants
+IMAGE_QUESTION = "Was ist auf dem Bild zu sehen?"
+DESCRIPTION_PROMPT = "Du bist ein nützlicher Assistent, der dabei hilft Produkte und deren Verpackungen zu beschreiben. Bei der Beschreibung ist zu unterscheiden zwischen der Beschreibung der Verpackung und dem Produkt selbst. Für die Beschreibung der Verpackung sind folgende Dimensionen wichtig: Form der Verpackung, Farbe, ggf. Muster/Bildelemente, die auf der Verpackung (und nicht auf dem Produkt) zu sehen sind, Anzahl der Produkte pro Verpackung. Für die Beschreibung des Produkts sind folgende Dimensionen wichtig: Form des Produkts, Farbe, ggf. Muster/Bildelemente des Produkts, andere besondere Details des Produkts (z.B. Perlen etc.) können genannt werden. Bitte bleibe sachlich und beschreibe nur das, was auf dem Bild zu sehen ist."
+# structured descriptions, JSON keys mapped to the columns they are stored in
+DESCRIPTION_ATTRIBUTES = {
+    "verpackung_form": "Verpackung Form",
+    "verpackung_farbe": "Verpackung Farbe",
+    "verpackung_muster": "Verpackung Muster",
+    "einheiten_pro_verpackung": "Einheiten pro Verpackung",
+    "produkt_form": "Produkt Form",
+    "produkt_farbe": "Produkt Farbe",
+    "produkt_muster": "Produkt Muster",
+    "produkt_details": "Produkt Details",
+}
+DESCRIPTION_SCHEMA = {
+    "name": "produktbeschreibung",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            key: (
+                {"type": ["integer", "null"]}
+                if key == "einheiten_pro_verpackung"
+                else {"type": "string"}
+            )
+            for key in DESCRIPTION_ATTRIBUTES
+        },
+        "required": list(DESCRIPTION_ATTRIBUTES),
+        "additionalProperties": False,
+    },
+}
+STRUCTURED_PROMPT = "Antworte ausschließlich mit kurzen Stichworten (1-3 Wörter) pro Feld, in Kleinbuchstaben. Ist ein Feld nicht erkennbar, antworte mit 'keine'. Ist die Anzahl der Produkte pro Verpackung nicht erkennbar, antworte mit null."
+# description cascade, each product escalates to the next tier until its
+# description passes check_description
+DESCRIPTION_TIERS = {
+    "Günstig (niedrige Auflösung)": {"model": "gpt-4o-mini", "detail": "low"},
+    "Hohe Auflösung": {"model": "gpt-4o-mini", "detail": "high"},
+    "Starkes Modell": {"model": "gpt-4o", "detail": "high"},
+}
+# USD per million input and output tokens
+MODEL_PRICES = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+}
+MIN_DESCRIPTION_LENGTH = 200
+# minimum average probability of the attribute value tokens, a starting point
+# that can be adjusted on the description page
+MIN_CONFIDENCE = 0.8
+# values of the structured answer, either a string, a number or null
+JSON_VALUE_PATTERN = re.compile(r'"[a-z_]+"\s*:\s*(?:"((?:[^"\\]|\\.)*)"|(-?\d+|null))')
+# product fields every image shows, packaging may legitimately be missing
+REQUIRED_ATTRIBUTES = ["produkt_form", "produkt_farbe"]
+
+
+def generate_description(
+    client, img_url, index, structured=False, tiers=None, min_confidence=MIN_CONFIDENCE
+):
+    """Generate a description for an image using OpenAI.
+
+    The image runs through the given DESCRIPTION_TIERS in order and only
+    moves on to the next tier if check_description rejects the result. In
+    structured mode the model answers with JSON following DESCRIPTION_SCHEMA,
+    the parsed attributes are returned alongside a short description text.
+    """
+    calls = []
+    for tier in tiers or list(DESCRIPTION_TIERS):
+        start = time.perf_counter()
+        completion = request_description(
+            client, img_url, structured, **DESCRIPTION_TIERS[tier]
+        )
+        description, attributes = parse_description(completion, structured)
+        # only structured answers are checked on confidence
+        confidence = description_confidence(completion) if structured else None
+        passed = check_description(
+            description, attributes, confidence, structured, min_confidence
+        )
+        input_price, output_price = MODEL_PRICES[DESCRIPTION_TIERS[tier]["model"]]
+        calls.append(
+            {
+                "Stufe": tier,
+                "Dauer": time.perf_counter() - start,
+                "Kosten": (
+                    completion.usage.prompt_tokens * input_price
+                    + completion.usage.completion_tokens * output_price
+                )
+                / 1_000_000,
+                "Konfidenz": confidence,
+                "Bestanden": passed,
+            }
+        )
+        if passed:
+            break
+    return index, description, img_url, attributes, calls
+
+
+def request_description(client, img_url, structured, model, detail):
+    """Request a description of an image from one model at one image detail."""
+    messages = [
+        {
+            "role": "system",
+            "content": DESCRIPTION_PROMPT,
+        },
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": IMAGE_QUESTION},
+                {"type": "image_url", "image_url": {"url": img_url, "detail": detail}},
+            ],
+        },
+    ]
+    if not structured:
+        return client.chat.completions.create(model=model, messages=messages)
+    messages.insert(1, {"role": "system", "content": STRUCTURED_PROMPT})
+    return client.chat.completions.create(
+        model=model,
+        messages=messages,
+        logprobs=True,
+        response_format={"type": "json_schema", "json_schema": DESCRIPTION_SCHEMA},
+    )
+
+
+def parse_description(completion, structured):
+    """Return the description text and, in structured mode, its attributes."""
+    content = completion.choices[0].message.content
+    if not structured:
+        return content, None
+    try:
+        attributes = json.loads(content)
+    except (TypeError, json.JSONDecodeError):
+        # refusals or truncated answers are kept as plain text
+        return content or "", None
+    description = "; ".join(
+        f"{column}: {attributes[key]}"
+        for key, column in DESCRIPTION_ATTRIBUTES.items()
+        if attributes.get(key) is not None
+    )
+    return description, attributes
+
+
+def description_confidence(completion):
+    """Average probability of the attribute value tokens of a structured answer.
+
+    The JSON punctuation and key names are almost certain and would hide
+    uncertain values, so only tokens inside the values count. Returns 1.0 if
+    no logprobs are returned.
+    """
+    logprobs = completion.choices[0].logprobs
+    if logprobs is None or not logprobs.content:
+        return 1.0
+    tokens = logprobs.content
+    text = "".join(token.token for token in tokens)
+    spans = [
+        match.span(1) if match.group(1) is not None else match.span(2)
+        for match in JSON_VALUE_PATTERN.finditer(text)
+    ]
+    ends = np.cumsum([len(token.token) for token in tokens])
+    starts = ends - [len(token.token) for token in tokens]
+    values = [
+        token
+        for token, start, end in zip(tokens, starts, ends)
+        if any(start < span_end and end > span_start for span_start, span_end in spans)
+    ]
+    return float(np.exp([token.logprob for token in values or tokens]).mean())
+
+
+def check_description(description, attributes, confidence, structured, min_confidence):
+    """Decide whether a description is good enough or needs the next tier.
+
+    Structured answers need the product fields and confident attribute
+    values, packaging fields may be 'keine' for images without packaging.
+    Free text is only checked for length and content, since its token
+    probabilities mostly reflect the choice of words.
+    """
+    if structured:
+        return (
+            confidence >= min_confidence
+            and attributes is not None
+            and all(
+                str(attributes.get(key) or "").strip().lower() not in ("", "keine")
+                for key in REQUIRED_ATTRIBUTES
+            )
+        )
+    text = (description or "").lower()
+    return len(text) >= MIN_DESCRIPTION_LENGTH and "produkt" in text
+
+
+def summarize_calls(calls):
+    """Aggregate latency and cost of all description calls per tier."""
+    if not calls:
+        return None
+    calls = pd.DataFrame(calls).astype({"Konfidenz": float})
+    stats = (
+        calls.groupby("Stufe", sort=False)
+        .agg(
+            Aufrufe=("Bestanden", "size"),
+            Bestanden=("Bestanden", "sum"),
+            Dauer_avg=("Dauer", "mean"),
+            Dauer_max=("Dauer", "max"),
+            Konfidenz_avg=("Konfidenz", "mean"),
+            Konfidenz_min=("Konfidenz", "min"),
+            Kosten=("Kosten", "sum"),
+        )
+        .rename(
+            columns={
+                "Dauer_avg": "Ø Dauer (s)",
+                "Dauer_max": "Max Dauer (s)",
+                "Konfidenz_avg": "Ø Konfidenz",
+                "Konfidenz_min": "Min Konfidenz",
+                "Kosten": "Kosten ($)",
+            }
+        )
+    )
+    stats.loc["Gesamt"] = [
+        stats["Aufrufe"].sum(),
+        stats["Bestanden"].sum(),
+        calls["Dauer"].mean(),
+        calls["Dauer"].max(),
+        calls["Konfidenz"].mean(),
+        calls["Konfidenz"].min(),
+        stats["Kosten ($)"].sum(),
+    ]
+    return stats.astype({"Aufrufe": int, "Bestanden": int})
+
+
+def store_attributes(df, attributes):
+    """Store parsed description attributes as typed columns of the DataFrame.
+
+    Products described without attributes get their old attributes cleared,
+    so they never outlive the description they were parsed from.
+    """
+    structured = {
+        index: values for index, values in attributes.items() if values is not None
+    }
+    columns = list(DESCRIPTION_ATTRIBUTES.values())
+    if not structured and not any(column in df for column in columns):
+        return
+    attribute_df = pd.DataFrame.from_dict(structured, orient="index").reindex(
+        index=list(attributes), columns=list(DESCRIPTION_ATTRIBUTES)
+    )
+    for key, column in DESCRIPTION_ATTRIBUTES.items():
+        if column in df:
+            values = df[column].astype(object)
+        else:
+            values = pd.Series(None, index=df.index, dtype=object)
+        values.loc[attribute_df.index] = attribute_df[key]
+        if key == "einheiten_pro_verpackung":
+            df[column] = pd.to_numeric(values, errors="coerce").astype("Int64")
+        else:
+            df[column] = values.str.strip().str.lower().astype("category")
@@ -0,0 +1,103 @@
+import streamlit as st
+import os
+import duckdb
+import pandas as pd
+
+# Constants
+RATING_COLUMN = "Durchschnittliche Produktbewertung (1=schlechteste Note, 5=beste Note)"
+# every upload is appended to this DuckDB file as a snapshot
+DATABASE_PATH = "data/history.duckdb"
+SNAPSHOT_COLUMNS = {
+    "Jahr": "jahr",
+    "Kategorie": "kategorie",
+    "Ranking in der Kategorie": "rang",
+    "Produktname": "produktname",
+    "Produkt URL": "produkt_url",
+    "Produktbild URL": "produktbild_url",
+    "Produktpreis": "produktpreis",
+    RATING_COLUMN: "bewertung",
+    "Abverkaufsmenge": "abverkaufsmenge",
+}
+DATABASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    snapshot VARCHAR,
+    hochgeladen_am TIMESTAMP,
+    jahr INTEGER,
+    kategorie VARCHAR,
+    rang INTEGER,
+    produktname VARCHAR,
+    produkt_url VARCHAR,
+    produktbild_url VARCHAR,
+    produktpreis DOUBLE,
+    bewertung DOUBLE,
+    abverkaufsmenge DOUBLE
+);
+CREATE OR REPLACE VIEW product_movements AS
+SELECT
+    *,
+    lag(rang) OVER w - rang AS rang_veraenderung,
+    produktpreis - lag(produktpreis) OVER w AS preis_veraenderung,
+    abverkaufsmenge - lag(abverkaufsmenge) OVER w AS abverkauf_veraenderung
+FROM snapshots
+WINDOW w AS (
+    PARTITION BY kategorie, produkt_url ORDER BY hochgeladen_am, snapshot, rang
+);
+"""
+
+
+@st.cache_resource
+def get_database():
+    """Open the file-backed DuckDB store that keeps the upload history."""
+    os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
+    connection = duckdb.connect(DATABASE_PATH)
+    connection.execute(DATABASE_SCHEMA)
+    return connection
+
+
+def store_snapshot(df, snapshot_id):
+    """Append an upload to the history unless this file was stored before."""
+    cursor = get_database().cursor()
+    exists = cursor.execute(
+        "SELECT 1 FROM snapshots WHERE snapshot = ? LIMIT 1", [snapshot_id]
+    ).fetchone()
+    if exists:
+        return False
+    snapshot = (
+        df[list(SNAPSHOT_COLUMNS)]
+        .rename(columns=SNAPSHOT_COLUMNS)
+        .assign(snapshot=snapshot_id, hochgeladen_am=pd.Timestamp.now())
+    )
+    cursor.register("upload", snapshot)
+    cursor.execute("INSERT INTO snapshots BY NAME SELECT * FROM upload")
+    cursor.unregister("upload")
+    return True
+
+
+def count_snapshots():
+    """Return the number of uploads kept in the history."""
+    cursor = get_database().cursor()
+    return cursor.execute("SELECT count(DISTINCT snapshot) FROM snapshots").fetchone()[0]
+
+
+def category_movements(snapshot_id, category, num):
+    """Return the top products of a category with their change to the previous upload.
+
+    The result is an Arrow table that Streamlit renders without copying it
+    into a DataFrame first.
+    """
+    cursor = get_database().cursor()
+    return cursor.execute(
+        """
+        SELECT
+            rang AS Rang,
+            produktname AS Produktname,
+            produktpreis AS Produktpreis,
+            rang_veraenderung AS "Rang Veränderung",
+            preis_veraenderung AS "Preis Veränderung",
+            abverkauf_veraenderung AS "Abverkaufsmenge Veränderung"
+        FROM product_movements
+        WHERE snapshot = ? AND kategorie = ? AND rang <= ?
+        ORDER BY rang
+        """,
+        [snapshot_id, category, num],
+    ).fetch_arrow_table()